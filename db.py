@@ -6,11 +6,14 @@ from config import DB_NAME
 
 
 class Database:
+    _schema_initialized = False
 
     def __enter__(self):
         self.__connection = sqlite3.connect(self._get_path())
         self.__cursor = self.__connection.cursor()
-        self.__init_table()
+        if not Database._schema_initialized:
+            self.__init_table()
+            Database._schema_initialized = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -105,3 +108,4 @@ class Database:
             "DROP TABLE subscriptions; "
         )
         self.__connection.commit()
+        Database._schema_initialized = False
@@ -1,38 +1,46 @@
 from apscheduler.schedulers.background import BackgroundScheduler
+from telebot import TeleBot
 
 import subscriptions
-from config import bot, logger
+from config import TELEBOT_TOKEN, logger
+from db import Database
 from subscriptions import job
 
 
-@bot.message_handler(commands=["start", "help"])
-def info(msg):
-    bot.reply_to(msg, "Бот для ведения учёта статистики брокерского портфеля Тинькофф.\n"
-                      "Доступные функции:\n"
-                      "/subscribe - подписка на обновления портфеля\n"
-                      "/unsubscribe - отписка от обновлений портфеля\n")
+def register_handlers(bot: TeleBot):
+    @bot.message_handler(commands=["start", "help"])
+    def info(msg):
+        bot.reply_to(msg, "Бот для ведения учёта статистики брокерского портфеля Тинькофф.\n"
+                          "Доступные функции:\n"
+                          "/subscribe - подписка на обновления портфеля\n"
+                          "/unsubscribe - отписка от обновлений портфеля\n")
 
+    @bot.message_handler(commands=["subscribe"])
+    def subscribe(msg):
+        bot.reply_to(msg, "Введите информацию о новой подписке в формате: "
+                          "<Tinkoff API token> "
+                          "<Broker account ID> "
+                     )
+        bot.register_next_step_handler(msg, subscriptions.subscribe, bot)
 
-@bot.message_handler(commands=["subscribe"])
-def subscribe(msg):
-    bot.reply_to(msg, "Введите информацию о новой подписке в формате: "
-                      "<Tinkoff API token> "
-                      "<Broker account ID> "
-                 )
-    bot.register_next_step_handler(msg, subscriptions.subscribe)
+    @bot.message_handler(commands=["unsubscribe"])
+    def unsubscribe(msg):
+        bot.reply_to(msg, "Введите информацию об отписке в формате: "
+                          "<Broker account ID> "
+                     )
+        bot.register_next_step_handler(msg, subscriptions.unsubscribe, bot)
 
 
-@bot.message_handler(commands=["unsubscribe"])
-def unsubscribe(msg):
-    bot.reply_to(msg, "Введите информацию об отписке в формате: "
-                      "<Broker account ID> "
-                 )
-    bot.register_next_step_handler(msg, subscriptions.unsubscribe)
+def main():
+    """Точка входа: бот, планировщик и схема БД создаются здесь, а не при импорте модулей"""
+    with Database():
+        pass
 
+    bot = TeleBot(TELEBOT_TOKEN)
+    register_handlers(bot)
 
-if __name__ == "__main__":
     scheduler = BackgroundScheduler()
-    scheduler.add_job(job, "interval", days=1)
+    scheduler.add_job(job, "interval", days=1, args=[bot])
     scheduler.start()
 
     try:
@@ -40,3 +48,7 @@ if __name__ == "__main__":
     except (KeyboardInterrupt, SystemExit) as e:
         scheduler.shutdown()
         logger.error(e)
+
+
+if __name__ == "__main__":
+    main()
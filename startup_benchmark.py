@@ -0,0 +1,99 @@
+# coding: utf8
+
+import os
+import re
+import subprocess
+import sys
+from typing import List, NamedTuple
+
+ENTRY_MODULE = "main"
+STARTUP_BUDGET_MS = int(os.getenv("STARTUP_BUDGET_MS", "1500"))
+FORBIDDEN_MODULES = ("tinkoff.invest", "grpc", "google.protobuf")
+RUNS = 5
+TOP_SIZE = 10
+IMPORTTIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+class ImportRecord(NamedTuple):
+    """Строка вывода python -X importtime"""
+    self_us: int
+    cumulative_us: int
+    depth: int
+    module: str
+
+
+def main():
+    runs = [_measure() for _ in range(RUNS)]
+    totals = sorted(_get_total_us(records) for records in runs)
+    median_ms = totals[len(totals) // 2] / 1000
+
+    print(f"cold start of '{ENTRY_MODULE}': median {median_ms:.1f} ms "
+          f"over {RUNS} runs (budget {STARTUP_BUDGET_MS} ms)")
+    print(f"slowest imports of '{ENTRY_MODULE}':")
+    for record in _get_entry_children(runs[-1])[:TOP_SIZE]:
+        print(f"  {record.cumulative_us / 1000:8.1f} ms  {record.module}")
+
+    failed = False
+    loaded = {record.module for record in runs[-1]}
+    for module in FORBIDDEN_MODULES:
+        if module in loaded:
+            print(f"FAIL: '{module}' is imported at startup")
+            failed = True
+    if median_ms > STARTUP_BUDGET_MS:
+        print(f"FAIL: startup exceeds budget by {median_ms - STARTUP_BUDGET_MS:.1f} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+def _measure() \
+        -> List[ImportRecord]:
+    """Импортирует точку входа в чистом интерпретаторе и разбирает вывод importtime"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {ENTRY_MODULE}"],
+        cwd=os.path.dirname(os.path.realpath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:"):
+                print(line)
+        sys.exit(completed.returncode)
+
+    res = []
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            depth = len(match.group(3)) // 2
+            res.append(ImportRecord(int(match.group(1)), int(match.group(2)), depth, match.group(4)))
+    return res
+
+
+def _get_top_level(records: List[ImportRecord]) \
+        -> List[ImportRecord]:
+    top_level = [record for record in records if record.depth == 0]
+    return sorted(top_level, key=lambda record: record.cumulative_us, reverse=True)
+
+
+def _get_entry_children(records: List[ImportRecord]) \
+        -> List[ImportRecord]:
+    """Прямые импорты точки входа: importtime печатает их перед строкой самой точки входа"""
+    children = []
+    for record in records:
+        if record.depth == 1:
+            children.append(record)
+        elif record.depth == 0:
+            if record.module == ENTRY_MODULE:
+                break
+            children = []
+    return sorted(children, key=lambda record: record.cumulative_us, reverse=True)
+
+
+def _get_total_us(records: List[ImportRecord]) \
+        -> int:
+    return sum(record.cumulative_us for record in _get_top_level(records))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,20 @@
 import os.path
 from dataclasses import dataclass
 from datetime import date
-from typing import NamedTuple
+from typing import NamedTuple, TYPE_CHECKING
 
 import telebot.types
-from tinkoff.invest import Operation
+from telebot import TeleBot
 
-from config import bot, REPORT_NAME, SUBSCRIPTION_MESSAGE_PATTERN, logger, BALANCE_SHORTCUT, RUBBLES_SHORTCUT
+from config import REPORT_NAME, SUBSCRIPTION_MESSAGE_PATTERN, logger, BALANCE_SHORTCUT, RUBBLES_SHORTCUT
 from db import Database
 from exceptions import NotEnoughArguments, InvalidPortfolioID, InvalidTinkoffToken, InvalidNumber
 from tinkoffapi import TinkoffApi
 from utils import handler, parse_int, get_canonical_price, to_rub, list_to_string
 
+if TYPE_CHECKING:
+    from tinkoff.invest import Operation
+
 
 class Profit(NamedTuple):
     """Структура выгоды в отчёте"""
@@ -65,7 +68,7 @@ class CSVRow(NamedTuple):
 
 
 @handler
-def subscribe(msg: telebot.types.Message):
+def subscribe(msg: telebot.types.Message, bot: TeleBot):
     try:
         parsed_subscription_msg = _parse_subscription_message(msg)
 
@@ -85,7 +88,7 @@ def subscribe(msg: telebot.types.Message):
 
 
 @handler
-def unsubscribe(msg: telebot.types.Message):
+def unsubscribe(msg: telebot.types.Message, bot: TeleBot):
     try:
         parsed_unsubscription_msg = _parse_unsubscription_message(msg)
 
@@ -103,13 +106,13 @@ def unsubscribe(msg: telebot.types.Message):
         logger.error(e)
 
 
-def job():
+def job(bot: TeleBot):
     with Database() as db:
         user_ids = db.get_user_ids()
         for user_id in user_ids:
             apis = db.get(user_id)
             for api in apis:
-                _notify(_parse_api(api), user_id)
+                _notify(_parse_api(api), user_id, bot)
 
 
 def _parse_subscription_message(msg: telebot.types.Message) \
@@ -142,7 +145,7 @@ def _parse_unsubscription_message(msg: telebot.types.Message) \
 
 
 @handler
-def _notify(api: TinkoffApi, user_id: int):
+def _notify(api: TinkoffApi, user_id: int, bot: TeleBot):
     try:
         _form_report(api)
         with open(REPORT_NAME, "rb") as f:
@@ -327,21 +330,21 @@ def _get_profit(income: int, outcome: int, currency: str) \
     return Profit(absolute_profit, relative_profit, currency)
 
 
-def _is_fee(operation: Operation) \
+def _is_fee(operation: "Operation") \
         -> bool:
     return operation.operation_type == operation.operation_type.OPERATION_TYPE_BROKER_FEE
 
 
-def _is_buy(operation: Operation) \
+def _is_buy(operation: "Operation") \
         -> bool:
     return operation.operation_type == operation.operation_type.OPERATION_TYPE_BUY
 
 
-def _is_input(operation: Operation) \
+def _is_input(operation: "Operation") \
         -> bool:
     return operation.operation_type == operation.operation_type.OPERATION_TYPE_INPUT
 
 
-def _is_usd(operation: Operation) \
+def _is_usd(operation: "Operation") \
         -> bool:
     return operation.currency == "usd"
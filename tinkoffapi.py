@@ -1,20 +1,32 @@
 # coding: utf8
 
 from datetime import datetime
-from typing import List
-
-from tinkoff.invest import Client, Operation, RequestError
+from typing import List, TYPE_CHECKING
 
 from exceptions import InvalidTinkoffToken, InvalidPortfolioID
 from utils import get_now, get_canonical_price
 
+if TYPE_CHECKING:
+    from tinkoff.invest import Client, Operation
+
+
+def _client(tinkoff_token: str) \
+        -> "Client":
+    """Единственное место, где импортируется клиент tinkoff.invest"""
+    from tinkoff.invest import Client
+
+    return Client(tinkoff_token)
+
 
 class TinkoffApi:
-    """Обёртка для работы с API Тинькова на основе библиотеки tinvest"""
+    """Обёртка для работы с API Тинькова на основе библиотеки tinvest.
+    Сама библиотека импортируется лениво, при первом обращении к API через _client"""
 
     def __init__(self, tinkoff_token: str, broker_account_id: int):
+        from tinkoff.invest import RequestError
+
         try:
-            with Client(tinkoff_token) as client:
+            with _client(tinkoff_token) as client:
                 ok = False
                 for account in client.users.get_accounts().accounts:
                     if int(account.id) == broker_account_id:
@@ -38,20 +50,20 @@ class TinkoffApi:
     def get_price(self, figi: str) \
             -> float:
         """Отдаёт текущую цену фиги в брокере"""
-        with Client(self._tinkoff_token) as client:
+        with _client(self._tinkoff_token) as client:
             price = client.market_data.get_last_prices(figi=[figi]).last_prices[0].price
         return get_canonical_price(price)
 
     def get_name(self, figi: str) \
             -> str:
         """Отдаёт наименование актива по figi"""
-        with Client(self._tinkoff_token) as client:
+        with _client(self._tinkoff_token) as client:
             return client.instruments.find_instrument(query=figi).instruments[0].name
 
     def get_ticker(self, figi: str) \
             -> str:
         """Отдаёт ticker актива по figi"""
-        with Client(self._tinkoff_token) as client:
+        with _client(self._tinkoff_token) as client:
             return client.instruments.find_instrument(query=figi).instruments[0].ticker
 
     def get_tinkoff_token(self) \
@@ -69,7 +81,7 @@ class TinkoffApi:
     @staticmethod
     def get_broker_account_ids(tinkoff_token: str) \
             -> List[int]:
-        with Client(tinkoff_token) as client:
+        with _client(tinkoff_token) as client:
             accounts = client.users.get_accounts().accounts
         res = []
         for account in accounts:
@@ -77,9 +89,9 @@ class TinkoffApi:
         return res
 
     def get_all_operations(self) \
-            -> List[Operation]:
+            -> List["Operation"]:
         """Возвращает все операции в портфеле с указанной даты"""
-        with Client(self._tinkoff_token) as client:
+        with _client(self._tinkoff_token) as client:
             return client \
                 .operations \
                 .get_operations(
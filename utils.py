@@ -1,11 +1,14 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from pytz import timezone
-from tinkoff.invest import MoneyValue
 
 from config import RUBBLES_SHORTCUT
 from exceptions import InvalidNumber
 
+if TYPE_CHECKING:
+    from tinkoff.invest import MoneyValue
+
 
 def handler(func):
     """Хендлеры имеют право не пробрасывать исключение вверх по иерархии, а осуществлять их обработку внутри себя"""
@@ -34,7 +37,7 @@ def parse_int(n: str) \
         raise InvalidNumber()
 
 
-def get_canonical_price(price: MoneyValue) -> float:
+def get_canonical_price(price: "MoneyValue") -> float:
     return float(str(abs(price.units)) + "." + str(abs(price.nano)))
 
 